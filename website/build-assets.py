@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Rebuild the website's generated assets (pricing PDFs, video ad renders)
+Usage: python3 build-assets.py [target ...] [--jobs N] [--force]
+
+Each target declares its input files and command. A target is rebuilt only
+when the content hash of its inputs and command has changed since its last
+successful build, or when one of its outputs is missing. Independent targets
+run in parallel, and each completed target is recorded immediately, so an
+interrupted run picks up where it left off.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+WEBSITE_DIR = os.path.dirname(os.path.abspath(__file__))
+VIDEO_DIR = os.path.join(WEBSITE_DIR, 'video-ad')
+STATE_FILE = os.path.join(WEBSITE_DIR, '.build-state.json')
+
+# Paths in inputs/outputs are relative to the target's cwd. Every pattern in
+# inputs must match at least one file; optional_inputs may match nothing.
+TARGETS = [
+    {
+        'name': 'pricing-pdf',
+        'cwd': WEBSITE_DIR,
+        'command': [sys.executable, 'gloo-pricing-strategy.py', '--optimize'],
+        'inputs': ['gloo-pricing-strategy.py'],
+        'optional_inputs': ['fonts/*.ttf'],
+        'outputs': ['Gloo-Pricing-Strategy.pdf'],
+    },
+    {
+        'name': 'proposal-bundle',
+        'cwd': WEBSITE_DIR,
+        'command': [sys.executable, 'gloo-pricing-strategy.py', '--optimize',
+                    '--bundle', 'tier1', 'tier2', 'tier3'],
+        'inputs': ['gloo-pricing-strategy.py'],
+        'optional_inputs': ['fonts/*.ttf'],
+        'outputs': ['Gloo-Pricing-Proposals.pdf'],
+    },
+    {
+        'name': 'video-ad',
+        'cwd': VIDEO_DIR,
+        'command': [sys.executable, 'compile-video.py'],
+        'inputs': ['compile-video.py', 'frame_*.png'],
+        'optional_inputs': [],
+        'outputs': [
+            'gloo-ad-10s.mp4',
+            'gloo-ad-instagram.mp4',
+            'gloo-ad-instagram-story.mp4',
+            'gloo-ad-twitter.mp4',
+            'gloo-ad-preview.gif',
+        ],
+    },
+]
+
+
+def load_state():
+    """Load the hashes recorded by previous successful builds"""
+    if not os.path.exists(STATE_FILE):
+        return {}
+    try:
+        with open(STATE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        print("Warning: build state is unreadable, rebuilding everything.")
+        return {}
+
+
+def save_state(state):
+    """Write the build state atomically so a crash never leaves it half-written"""
+    tmp_path = STATE_FILE + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, STATE_FILE)
+
+
+def resolve_inputs(target):
+    """Return the sorted input files, or None if a required input is missing"""
+    files = set()
+    for pattern in target['inputs']:
+        matches = glob.glob(os.path.join(target['cwd'], pattern))
+        if not matches:
+            return None
+        files.update(matches)
+    for pattern in target['optional_inputs']:
+        files.update(glob.glob(os.path.join(target['cwd'], pattern)))
+    return sorted(files)
+
+
+def hash_target(target, files):
+    """Content hash of the command and every input file"""
+    digest = hashlib.sha256()
+    # Hash the arguments only, so switching Python interpreters is not a change
+    digest.update(json.dumps(target['command'][1:]).encode())
+    for path in files:
+        digest.update(os.path.relpath(path, target['cwd']).encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def outputs_exist(target):
+    return all(os.path.exists(os.path.join(target['cwd'], path)) for path in target['outputs'])
+
+
+def stale_outputs(target, since):
+    """Outputs that are missing or were not written after `since`"""
+    # Round down to allow for filesystems with one-second timestamps
+    since = math.floor(since)
+    stale = []
+    for path in target['outputs']:
+        full_path = os.path.join(target['cwd'], path)
+        if not os.path.exists(full_path) or os.path.getmtime(full_path) < since:
+            stale.append(path)
+    return stale
+
+
+def run_target(target):
+    """Run a target's command and return (success, seconds, error output)"""
+    started_at = time.time()
+    start = time.monotonic()
+    result = subprocess.run(target['command'], cwd=target['cwd'], capture_output=True, text=True)
+    elapsed = time.monotonic() - start
+
+    if result.returncode != 0:
+        return False, elapsed, result.stderr or result.stdout
+    # The scripts report some failures on stdout and still exit 0, possibly
+    # leaving outputs from an earlier run in place, so every output must
+    # have been written by this run
+    stale = stale_outputs(target, started_at)
+    if stale:
+        return False, elapsed, f"{result.stdout.strip()}\nNot written by this run: {', '.join(stale)}"
+    return True, elapsed, ''
+
+
+def print_summary(results, wall_time):
+    """Print per-target status and timing"""
+    print("\nBuild summary")
+    print("=" * 50)
+    for name, status, seconds in results:
+        timing = f"{seconds:7.2f}s" if seconds is not None else "      -"
+        print(f"{name:<20} {status:<12} {timing}")
+    print("-" * 50)
+    job_time = sum(seconds for _, _, seconds in results if seconds is not None)
+    print(f"{'Total':<20} {'':<12} {wall_time:7.2f}s (jobs: {job_time:.2f}s)")
+
+
+def build(names=None, jobs=1, force=False):
+    """Rebuild stale targets in parallel; returns True if nothing failed"""
+    targets = [t for t in TARGETS if not names or t['name'] in names]
+    state = load_state()
+    results = []
+    pending = {}
+
+    for target in targets:
+        files = resolve_inputs(target)
+        if files is None:
+            print(f"- {target['name']}: missing inputs, skipping")
+            results.append((target['name'], 'skipped', None))
+            continue
+
+        content_hash = hash_target(target, files)
+        recorded = state.get(target['name'], {}).get('hash')
+        if not force and recorded == content_hash and outputs_exist(target):
+            print(f"- {target['name']}: up to date")
+            results.append((target['name'], 'up to date', None))
+            continue
+
+        pending[target['name']] = (target, content_hash)
+
+    start = time.monotonic()
+    ok = True
+    if pending:
+        print(f"\nBuilding {len(pending)} target(s) with up to {jobs} workers...")
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(run_target, target): name for name, (target, _) in pending.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            success, seconds, error = future.result()
+            if success:
+                print(f"✓ Built {name} in {seconds:.2f}s")
+                # Record right away so a later crash does not redo this job
+                state[name] = {'hash': pending[name][1], 'seconds': round(seconds, 2)}
+                save_state(state)
+                results.append((name, 'built', seconds))
+            else:
+                ok = False
+                print(f"✗ Failed {name}")
+                print(error.strip()[-2000:])
+                results.append((name, 'failed', seconds))
+
+    print_summary(results, time.monotonic() - start)
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the website's generated assets")
+    names = [t['name'] for t in TARGETS]
+    parser.add_argument('targets', nargs='*', metavar='target',
+                        help=f"Targets to build (default: all of {', '.join(names)})")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Maximum number of targets to build at once (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="Rebuild even if up to date")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.targets if name not in names]
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(unknown)}")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    if not build(args.targets, jobs=args.jobs, force=args.force):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,23 @@
+import argparse
+import io
+import os
+import shutil
+import subprocess
+from xml.sax.saxutils import escape
+
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, HRFlowable
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import Flowable, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, HRFlowable
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_PATH = os.path.join(SCRIPT_DIR, 'Gloo-Pricing-Strategy.pdf')
+BUNDLE_OUTPUT_PATH = os.path.join(SCRIPT_DIR, 'Gloo-Pricing-Proposals.pdf')
+
 # Gloo brand colors
 GLOO_PRIMARY = colors.HexColor('#6366F1')  # Indigo
 GLOO_SECONDARY = colors.HexColor('#8B5CF6')  # Purple
@@ -12,18 +25,67 @@ GLOO_DARK = colors.HexColor('#1E1B4B')  # Dark indigo
 GLOO_LIGHT = colors.HexColor('#E0E7FF')  # Light indigo
 GLOO_SUCCESS = colors.HexColor('#10B981')  # Green for recommended
 
-def create_pdf():
-    doc = SimpleDocTemplate(
-        "/Users/shayanmirzazadeh/Documents/Vibes/Glue/website/Gloo-Pricing-Strategy.pdf",
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
+# Built-in fonts (not embedded) used when no brand fonts are available
+DEFAULT_FONTS = {
+    'regular': 'Helvetica',
+    'bold': 'Helvetica-Bold',
+    'italic': 'Helvetica-Oblique',
+}
+
+# Optional brand fonts, looked up in website/fonts/
+BRAND_FONT_DIR = os.path.join(SCRIPT_DIR, 'fonts')
+BRAND_FONT_FAMILY = 'GlooSans'
+BRAND_FONT_FILES = {
+    'regular': 'GlooSans-Regular.ttf',
+    'bold': 'GlooSans-Bold.ttf',
+    'italic': 'GlooSans-Italic.ttf',
+}
+
+# Pricing tiers a proposal variant can be based on; 'tier' is the
+# highlighted row in the pricing table
+PROPOSAL_TIERS = {
+    'tier1': {'label': 'Tier 1 - Single Tool', 'tier': 1},
+    'tier2': {'label': 'Tier 2 - Tool Bundle', 'tier': 2},
+    'tier3': {'label': 'Tier 3 - Full Platform', 'tier': 3},
+}
+
+
+def register_brand_fonts(font_dir=BRAND_FONT_DIR):
+    """Register the brand TTF fonts if present, else fall back to Helvetica.
+
+    ReportLab embeds TrueType fonts as subsets, so only the glyphs the
+    document actually uses end up in the PDF.
+    """
+    paths = {role: os.path.join(font_dir, name) for role, name in BRAND_FONT_FILES.items()}
+    if not all(os.path.exists(path) for path in paths.values()):
+        return dict(DEFAULT_FONTS)
+
+    fonts = {}
+    for role, path in paths.items():
+        name = f"{BRAND_FONT_FAMILY}-{role.capitalize()}"
+        pdfmetrics.registerFont(TTFont(name, path))
+        fonts[role] = name
+
+    # Lets <b> and <i> markup inside paragraphs resolve to the brand faces
+    pdfmetrics.registerFontFamily(
+        fonts['regular'],
+        normal=fonts['regular'],
+        bold=fonts['bold'],
+        italic=fonts['italic'],
+        boldItalic=fonts['bold']
     )
+    return fonts
+
 
+def build_styles(fonts):
+    """Build the paragraph stylesheet using the given font set"""
     styles = getSampleStyleSheet()
 
+    # Base styles are copied into children on creation, so set fonts first
+    styles['Normal'].fontName = fonts['regular']
+    for name in ('Title', 'Heading1', 'Heading2'):
+        styles[name].fontName = fonts['bold']
+
     # Custom styles
     styles.add(ParagraphStyle(
         name='MainTitle',
@@ -103,9 +165,29 @@ def create_pdf():
         spaceBefore=10,
         spaceAfter=10,
         leading=14,
-        fontName='Helvetica-Oblique'
+        fontName=fonts['italic']
     ))
 
+    return styles
+
+
+def table_style(fonts, commands):
+    """TableStyle whose cells default to the document's regular font.
+
+    Plain-string cells otherwise fall back to Table's built-in Helvetica,
+    which would mix typefaces when brand fonts are in use. Later commands
+    (bold headers etc.) still override this base font.
+    """
+    return TableStyle([('FONTNAME', (0, 0), (-1, -1), fonts['regular'])] + commands)
+
+
+def build_story(styles, fonts, variant=None):
+    """Build the list of flowables that make up the document.
+
+    variant comes from parse_variant(); it highlights its tier in the
+    pricing table and, when a recipient is given, names them on the
+    title page.
+    """
     story = []
 
     # Title Page
@@ -131,6 +213,15 @@ def create_pdf():
         alignment=TA_CENTER,
         spaceAfter=40
     )))
+    if variant and variant['recipient']:
+        story.append(Paragraph(f"Prepared for: {escape(variant['recipient'])}", ParagraphStyle(
+            'PreparedFor',
+            parent=styles['Normal'],
+            fontSize=12,
+            textColor=GLOO_PRIMARY,
+            alignment=TA_CENTER,
+            fontName=fonts['bold']
+        )))
     story.append(Spacer(1, 1*inch))
     story.append(Paragraph("CONFIDENTIAL - Internal Use Only", ParagraphStyle(
         'Footer',
@@ -184,11 +275,11 @@ def create_pdf():
     ]
 
     summary_table = Table(summary_data, colWidths=[2.5*inch, 1.8*inch, 1.8*inch])
-    summary_table.setStyle(TableStyle([
+    summary_table.setStyle(table_style(fonts, [
         ('BACKGROUND', (0, 0), (-1, 0), GLOO_PRIMARY),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (-1, 0), fonts['bold']),
         ('FONTSIZE', (0, 0), (-1, 0), 10),
         ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
         ('TOPPADDING', (0, 0), (-1, 0), 10),
@@ -199,7 +290,7 @@ def create_pdf():
         ('TOPPADDING', (0, 1), (-1, -1), 8),
         ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
         ('BACKGROUND', (0, -1), (-1, -1), GLOO_LIGHT),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (0, -1), (-1, -1), fonts['bold']),
     ]))
     story.append(summary_table)
 
@@ -227,11 +318,11 @@ def create_pdf():
     ]
 
     comp_table = Table(competitor_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-    comp_table.setStyle(TableStyle([
+    comp_table.setStyle(table_style(fonts, [
         ('BACKGROUND', (0, 0), (-1, 0), GLOO_DARK),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (-1, 0), fonts['bold']),
         ('FONTSIZE', (0, 0), (-1, -1), 9),
         ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
         ('TOPPADDING', (0, 0), (-1, 0), 10),
@@ -239,7 +330,7 @@ def create_pdf():
         ('TOPPADDING', (0, 1), (-1, -1), 8),
         ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
         ('BACKGROUND', (0, -1), (-1, -1), GLOO_LIGHT),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (0, -1), (-1, -1), fonts['bold']),
     ]))
     story.append(comp_table)
 
@@ -276,12 +367,12 @@ def create_pdf():
     ]
 
     ip_table = Table(ip_data, colWidths=[1.3*inch, 1.8*inch, 1.2*inch, 1.7*inch])
-    ip_table.setStyle(TableStyle([
+    ip_table.setStyle(table_style(fonts, [
         ('BACKGROUND', (0, 0), (-1, 0), GLOO_PRIMARY),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (-1, 0), fonts['bold']),
         ('FONTSIZE', (0, 0), (-1, -1), 9),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
         ('TOPPADDING', (0, 0), (-1, -1), 10),
@@ -330,12 +421,12 @@ def create_pdf():
     ]
 
     model1_table = Table(model1_data, colWidths=[2.5*inch, 3*inch])
-    model1_table.setStyle(TableStyle([
+    model1_table.setStyle(table_style(fonts, [
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FEE2E2')),
         ('TEXTCOLOR', (0, 0), (-1, -1), GLOO_DARK),
         ('ALIGN', (0, 0), (0, -1), 'LEFT'),
         ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (-1, 0), fonts['bold']),
         ('FONTSIZE', (0, 0), (-1, -1), 9),
         ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E5E7EB')),
         ('TOPPADDING', (0, 0), (-1, -1), 6),
@@ -362,12 +453,12 @@ def create_pdf():
     ]
 
     model2_table = Table(model2_data, colWidths=[2.5*inch, 3*inch])
-    model2_table.setStyle(TableStyle([
+    model2_table.setStyle(table_style(fonts, [
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#DBEAFE')),
         ('TEXTCOLOR', (0, 0), (-1, -1), GLOO_DARK),
         ('ALIGN', (0, 0), (0, -1), 'LEFT'),
         ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (-1, 0), fonts['bold']),
         ('FONTSIZE', (0, 0), (-1, -1), 9),
         ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E5E7EB')),
         ('TOPPADDING', (0, 0), (-1, -1), 6),
@@ -394,12 +485,12 @@ def create_pdf():
     ]
 
     model3_table = Table(model3_data, colWidths=[2.5*inch, 3*inch])
-    model3_table.setStyle(TableStyle([
+    model3_table.setStyle(table_style(fonts, [
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#D1FAE5')),
         ('TEXTCOLOR', (0, 0), (-1, -1), GLOO_DARK),
         ('ALIGN', (0, 0), (0, -1), 'LEFT'),
         ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (-1, 0), fonts['bold']),
         ('FONTSIZE', (0, 0), (-1, -1), 9),
         ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E5E7EB')),
         ('TOPPADDING', (0, 0), (-1, -1), 6),
@@ -409,7 +500,7 @@ def create_pdf():
     ]))
     story.append(model3_table)
     story.append(Paragraph("✓  Best of both: upfront cash + compounding ARR + strong valuation", ParagraphStyle(
-        'Success', parent=styles['Normal'], fontSize=9, textColor=colors.HexColor('#059669'), spaceBefore=5, fontName='Helvetica-Bold'
+        'Success', parent=styles['Normal'], fontSize=9, textColor=colors.HexColor('#059669'), spaceBefore=5, fontName=fonts['bold']
     )))
 
     story.append(PageBreak())
@@ -426,12 +517,12 @@ def create_pdf():
     ]
 
     pricing_table = Table(pricing_data, colWidths=[1.3*inch, 1.3*inch, 1.3*inch, 2.1*inch])
-    pricing_table.setStyle(TableStyle([
+    pricing_table.setStyle(table_style(fonts, [
         ('BACKGROUND', (0, 0), (-1, 0), GLOO_PRIMARY),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (-1, 0), fonts['bold']),
         ('FONTSIZE', (0, 0), (-1, -1), 9),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
         ('TOPPADDING', (0, 0), (-1, -1), 12),
@@ -439,8 +530,14 @@ def create_pdf():
         ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#EEF2FF')),
         ('BACKGROUND', (0, 2), (-1, 2), colors.HexColor('#E0E7FF')),
         ('BACKGROUND', (0, 3), (-1, 3), colors.HexColor('#C7D2FE')),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 1), (0, -1), fonts['bold']),
     ]))
+    if variant:
+        row = variant['tier']
+        pricing_table.setStyle(TableStyle([
+            ('BOX', (0, row), (-1, row), 2, GLOO_SUCCESS),
+            ('FONTNAME', (0, row), (-1, row), fonts['bold']),
+        ]))
     story.append(pricing_table)
 
     story.append(Spacer(1, 25))
@@ -454,11 +551,11 @@ def create_pdf():
     ]
 
     buyout_table = Table(buyout_data, colWidths=[2*inch, 2*inch, 2*inch])
-    buyout_table.setStyle(TableStyle([
+    buyout_table.setStyle(table_style(fonts, [
         ('BACKGROUND', (0, 0), (-1, 0), GLOO_DARK),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (-1, 0), fonts['bold']),
         ('FONTSIZE', (0, 0), (-1, -1), 9),
         ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E5E7EB')),
         ('TOPPADDING', (0, 0), (-1, -1), 8),
@@ -498,10 +595,10 @@ def create_pdf():
             fontSize=11,
             textColor=GLOO_DARK,
             leading=16,
-            fontName='Helvetica-Oblique'
+            fontName=fonts['italic']
         ))]],
         colWidths=[6*inch],
-        style=TableStyle([
+        style=table_style(fonts, [
             ('BACKGROUND', (0, 0), (-1, -1), GLOO_LIGHT),
             ('BOX', (0, 0), (-1, -1), 2, GLOO_PRIMARY),
             ('TOPPADDING', (0, 0), (-1, -1), 15),
@@ -533,25 +630,220 @@ def create_pdf():
     ]
 
     obj_table = Table(objections_data, colWidths=[1.8*inch, 4.2*inch])
-    obj_table.setStyle(TableStyle([
+    obj_table.setStyle(table_style(fonts, [
         ('BACKGROUND', (0, 0), (-1, 0), GLOO_DARK),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
         ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 0), (-1, 0), fonts['bold']),
         ('FONTSIZE', (0, 0), (-1, -1), 9),
         ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E5E7EB')),
         ('TOPPADDING', (0, 0), (-1, -1), 10),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
         ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Oblique'),
+        ('FONTNAME', (0, 1), (0, -1), fonts['italic']),
         ('TEXTCOLOR', (0, 1), (0, -1), colors.HexColor('#6B7280')),
     ]))
     story.append(obj_table)
 
-    # Build PDF
-    doc.build(story)
-    print("PDF created successfully: Gloo-Pricing-Strategy.pdf")
+    return story
+
+
+class OutlineEntry(Flowable):
+    """Zero-size flowable that bookmarks its page in the PDF outline"""
+
+    def __init__(self, title, key, level=0):
+        Flowable.__init__(self)
+        self.title = title
+        self.key = key
+        self.level = level
+
+    def wrap(self, availWidth, availHeight):
+        return (0, 0)
+
+    def draw(self):
+        self.canv.bookmarkPage(self.key)
+        self.canv.addOutlineEntry(self.title, self.key, level=self.level, closed=False)
+
+
+class BundleDocTemplate(SimpleDocTemplate):
+    """Adds an outline entry under the current variant for each section"""
+
+    def afterFlowable(self, flowable):
+        if isinstance(flowable, Paragraph) and flowable.style.name == 'SectionHeader':
+            self._section_count = getattr(self, '_section_count', 0) + 1
+            key = f"section-{self._section_count}"
+            self.canv.bookmarkPage(key)
+            self.canv.addOutlineEntry(flowable.getPlainText(), key, level=1, closed=True)
+
+
+def make_doc(output, doc_class=SimpleDocTemplate):
+    """Create the page template (ReportLab compresses page streams by default)"""
+    return doc_class(
+        output,
+        pagesize=letter,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch
+    )
+
+
+def check_qpdf():
+    """Check if qpdf is installed"""
+    if shutil.which('qpdf') is None:
+        print("Warning: qpdf is not installed, skipping the optimization pass.")
+        print("Install it using: brew install qpdf")
+        return False
+    return True
+
+
+def rewrite_pdf(path, linearize=False):
+    """Rewrite the PDF in place with qpdf to make it smaller.
+
+    Packs the many small objects ReportLab writes (font, page and resource
+    dictionaries) into compressed object streams and recompresses every
+    stream at the highest level. With linearize, the file is also laid out
+    for fast web view so the first page renders before the download ends.
+    """
+    if not check_qpdf():
+        return False
+
+    tmp_path = path + '.tmp'
+    cmd = [
+        'qpdf',
+        '--object-streams=generate',  # Pack small objects together
+        '--recompress-flate',
+        '--compression-level=9',
+        path,
+        tmp_path
+    ]
+    if linearize:
+        cmd.insert(1, '--linearize')
+
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    # qpdf exits with 3 when it succeeded with warnings
+    if result.returncode not in (0, 3):
+        print(f"Error optimizing PDF: {result.stderr}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+    os.replace(tmp_path, path)
+    return True
+
+
+def format_size(num_bytes):
+    return f"{num_bytes / 1024:.1f} KB"
+
+
+def describe_size_change(before, after):
+    """e.g. '13.9 KB -> 11.2 KB (19% smaller)'"""
+    change = 100 * abs(after - before) / before if before else 0
+    direction = 'larger' if after > before else 'smaller'
+    return f"{format_size(before)} -> {format_size(after)} ({change:.0f}% {direction})"
+
+
+def create_pdf(output=OUTPUT_PATH, optimize=False, linearize=False, compare=False):
+    """Build the pricing strategy PDF.
+
+    With optimize, brand fonts (if any) are embedded as subsets and the
+    file is rewritten by qpdf into compressed object streams. Embedding
+    fonts makes the file larger than one using the built-in Helvetica;
+    that is the cost of rendering in the brand typeface.
+
+    compare also builds the document with default settings in memory and
+    reports the size against it. It doubles the build time, so it is off
+    unless asked for.
+    """
+    fonts = register_brand_fonts() if optimize else dict(DEFAULT_FONTS)
+    make_doc(output).build(build_story(build_styles(fonts), fonts))
+    print(f"PDF created successfully: {os.path.basename(output)}")
+
+    if optimize:
+        size_built = os.path.getsize(output)
+        if rewrite_pdf(output, linearize=linearize):
+            print(f"qpdf pass: {describe_size_change(size_built, os.path.getsize(output))}")
+
+    if compare:
+        baseline = io.BytesIO()
+        make_doc(baseline).build(build_story(build_styles(DEFAULT_FONTS), DEFAULT_FONTS))
+        size_before = len(baseline.getvalue())
+        print(f"Versus default build: {describe_size_change(size_before, os.path.getsize(output))}")
+    else:
+        print(f"File size: {format_size(os.path.getsize(output))}")
+    return output
+
+
+def parse_variant(spec):
+    """Parse a --bundle entry such as 'tier2' or 'tier2:Acme Corp (EMEA)'"""
+    key, _, recipient = spec.partition(':')
+    if key not in PROPOSAL_TIERS:
+        raise argparse.ArgumentTypeError(
+            f"unknown tier '{key}' (choose from {', '.join(PROPOSAL_TIERS)})")
+    return dict(PROPOSAL_TIERS[key], recipient=recipient.strip() or None)
+
+
+def variant_title(variant):
+    if variant['recipient']:
+        return f"{variant['recipient']} - {variant['label']}"
+    return variant['label']
+
+
+def create_bundle(variants, output=BUNDLE_OUTPUT_PATH, optimize=False, linearize=False):
+    """Render several proposal variants into a single PDF in one build.
+
+    variants are dicts from parse_variant(). Each gets a top-level outline
+    entry with its sections nested below.
+
+    Brand fonts, when embedded, are written once and shared by every
+    variant instead of once per file. The built-in Helvetica fonts are
+    never embedded, so without brand fonts there is nothing to share and
+    the bundle is about the size of the separate PDFs combined.
+    """
+    fonts = register_brand_fonts() if optimize else dict(DEFAULT_FONTS)
+    styles = build_styles(fonts)
+
+    story = []
+    for index, variant in enumerate(variants):
+        if index:
+            story.append(PageBreak())
+        story.append(OutlineEntry(variant_title(variant), f"variant-{index}"))
+        story.extend(build_story(styles, fonts, variant))
+
+    doc = make_doc(output, doc_class=BundleDocTemplate)
+    doc.build(story, onFirstPage=lambda canv, doc: canv.showOutline())
+
+    if optimize:
+        rewrite_pdf(output, linearize=linearize)
+
+    print(f"PDF bundle created successfully: {os.path.basename(output)}")
+    print(f"Variants: {', '.join(variant_title(v) for v in variants)}")
+    print(f"File size: {format_size(os.path.getsize(output))}")
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the Gloo pricing strategy PDF")
+    parser.add_argument('--output', help="Path of the PDF to write")
+    parser.add_argument('--optimize', action='store_true',
+                        help="Embed subset brand fonts and pack objects into object streams (uses qpdf)")
+    parser.add_argument('--linearize', action='store_true',
+                        help="Linearize for fast web view (requires qpdf, implies --optimize)")
+    parser.add_argument('--compare', action='store_true',
+                        help="Also build with default settings and report the size difference")
+    parser.add_argument('--bundle', nargs='+', type=parse_variant, metavar='TIER[:RECIPIENT]',
+                        help=f"Render these variants into one PDF, e.g. tier2:'Acme Corp' "
+                             f"(tiers: {', '.join(PROPOSAL_TIERS)})")
+    args = parser.parse_args()
+
+    optimize = args.optimize or args.linearize
+    if args.bundle:
+        create_bundle(args.bundle, args.output or BUNDLE_OUTPUT_PATH,
+                      optimize=optimize, linearize=args.linearize)
+    else:
+        create_pdf(args.output or OUTPUT_PATH, optimize=optimize, linearize=args.linearize,
+                   compare=args.compare)
 
 if __name__ == "__main__":
-    create_pdf()
+    main()